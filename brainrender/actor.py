@@ -1,15 +1,48 @@
+import threading
 from io import StringIO
 
 import numpy as np
 import pyinspect as pi
 from myterial import amber, orange, salmon
 from rich.console import Console
-from vedo import Sphere, Text3D
+from vedo import LinearTransform, Points, Sphere, Text3D
+from vedo.utils import OperationNode, vtk2numpy
 
 from brainrender._utils import listify
 
-# transform matrix to fix labels orientation
-label_mtx = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+# identity matrix, not used to orient labels (see label_rotation_mtx)
+label_mtx = np.eye(4)
+
+# 180 degrees rotation around x followed by 180 degrees around y
+label_rotation_mtx = np.diag([-1.0, -1.0, 1.0, 1.0])
+
+# template for the spheres marking label anchors, cloned for each label
+_unit_sphere = Sphere(r=1, res=8).compute_normals()
+
+# attributes always taken from .mesh, all others come from ._mesh if it exists
+_mesh_attributes = frozenset(("center_of_mass",))
+_missing = object()
+
+# per-thread console used to render actors to string
+_str_console = threading.local()
+
+# prefixes of the lines printed by Actor.__rich_console__
+_rep_name = f"[b {orange}]name:[/b {orange}][{amber}] "
+_rep_type = f"[b {orange}]type:[/b {orange}][{amber}] "
+_rep_com = f"[{orange}]center of mass:[/{orange}][{amber}] "
+_rep_npoints = f"[{orange}]number of vertices:[/{orange}][{amber}] "
+_rep_dimensions = f"[{orange}]dimensions:[/{orange}][{amber}] "
+_rep_color = f"[{orange}]color:[/{orange}][{amber}] "
+
+
+def _anchor_from_verts(verts, shift):
+    """
+    Finds the vertex with the lowest y coordinate (the mesh's highest
+    point), shifts it by `shift` and flips its z coordinate.
+    """
+    point = verts[np.argmin(verts[:, 1])] + shift
+    point[2] = -point[2]
+    return point
 
 
 def make_actor_label(
@@ -34,54 +67,97 @@ def make_actor_label(
                         if None a gray color is used. Default None.
                 - xoffset, yoffset, zoffset: integers that shift the label position
                 - radius: radius of sphere used to denote label anchor. Set to 0 or None to hide.
+    :return: list of text meshes followed by the anchor spheres
     """
-    offset = [-yoffset, -zoffset, xoffset]
-    default_offset = np.array([0, -200, 100])
+    actors = listify(actors)
+    labels = listify(labels)
 
-    new_actors = []
-    for _, (actor, label) in enumerate(zip(listify(actors), listify(labels))):
-        # Get label color
-        if color is None:
-            color = [0.2, 0.2, 0.2]
+    # only actors with a matching label are labelled
+    n = min(len(actors), len(labels))
+    if not n:
+        return []
+    actors, labels = actors[:n], labels[:n]
 
-        # Get mesh's highest point
-        points = actor.mesh.vertices.copy()
-        point = points[np.argmin(points[:, 1]), :]
-        point += np.array(offset) + default_offset
-        point[2] = -point[2]
+    offset = [-yoffset, -zoffset, xoffset]
+    default_offset = np.array([0, -200, 100])
+    delta = np.asarray(offset, dtype=np.float64) + default_offset
+
+    # Get label color
+    if color is None:
+        color = [0.2, 0.2, 0.2]
+
+    # Get each mesh's highest point
+    points = np.array(
+        [_anchor_from_verts(actor.mesh.vertices, delta) for actor in actors],
+        dtype=np.float64,
+    )
+
+    # Move labels on the left hemisphere to the right one,
+    # points outside of the atlas volume are not moved
+    shape = np.asarray(atlas.hemispheres.shape)
+    coords = np.trunc(points)
+    inside = np.all((coords >= -shape) & (coords < shape), axis=1)
+
+    # hemispheres: 1 - left, 2 - right
+    left_value = getattr(atlas, "left_hemisphere_value", 1)
+    left = np.zeros(len(points), dtype=bool)
+    left[inside] = (
+        atlas.hemispheres[tuple(coords[inside].astype(np.int64).T)]
+        == left_value
+    )
+    if left.any():
+        points[left] = [
+            atlas.mirror_point_across_hemispheres(point)
+            for point in points[left]
+        ]
 
-        try:
-            if atlas.hemisphere_from_coords(point, as_string=True) == "left":
-                point = atlas.mirror_point_across_hemispheres(point)
-        except IndexError:
-            pass
-
-        # Create label
-        txt = Text3D(
-            label, point * np.array([-1, -1, -1]), s=size, c=color, depth=0.1
+    # Create labels
+    texts = [
+        Text3D(label, -point, s=size, c=color, depth=0.1).apply_transform(
+            label_rotation_mtx
         )
-        new_actors.append(txt.rotate_x(180).rotate_y(180))
-
-        # Mark a point on Mesh that corresponds to the label location
-        if radius is not None:
-            pt = actor.closest_point(point)
-            pt[2] = -pt[2]
-            sphere = Sphere(pt, r=radius, c=color, res=8)
+        for label, point in zip(labels, points)
+    ]
+
+    # Mark a point on each Mesh that corresponds to the label location
+    spheres = []
+    if radius is not None:
+        anchors = np.array(
+            [
+                actor.closest_point(point)
+                for actor, point in zip(actors, points)
+            ]
+        )
+        anchors[:, 2] = -anchors[:, 2]
+        for pt in anchors:
+            sphere = _unit_sphere.clone().scale(radius).pos(pt).c(color)
             sphere.ancor = pt
-            new_actors.append(sphere)
-            sphere.compute_normals()
+            spheres.append(sphere)
 
-    return new_actors
+    return texts + spheres
 
 
 class Actor:
-    _needs_label = False  # needs to make a label
-    _needs_silhouette = False  # needs to make a silhouette
-    _is_transformed = False  # has been transformed to correct axes orientation
-    _is_added = False  # has the actor been added to the scene already
-
-    labels = []
-    silhouette = None
+    __slots__ = (
+        "mesh",
+        "_mesh",
+        "name",
+        "br_class",
+        "is_text",
+        "_com_cache",
+        "_com_buf",
+        "_bounds_buf",
+        "labels",
+        "silhouette",
+        "_needs_label",
+        "_needs_silhouette",
+        "_is_transformed",
+        "_is_added",
+        "_label_str",
+        "_label_kwargs",
+        "_silhouette_kwargs",
+        "_silhouette_key",
+    )
 
     def __init__(
         self,
@@ -111,6 +187,19 @@ class Actor:
         self.name = name or "Actor"
         self.br_class = br_class or "None"
         self.is_text = is_text
+        self._com_cache = None  # (mesh modified time, center of mass)
+        self._com_buf = None  # int buffers used when printing the actor
+        self._bounds_buf = None
+
+        self._needs_label = False  # needs to make a label
+        self._needs_silhouette = False  # needs to make a silhouette
+        # has been transformed to correct axes orientation
+        self._is_transformed = False
+        self._is_added = False  # has the actor been added to the scene already
+
+        self.labels = []
+        self.silhouette = None
+        self._silhouette_key = None  # inputs used to make self.silhouette
 
         if color:
             self.mesh.c(color)
@@ -122,34 +211,40 @@ class Actor:
         If an unknown attribute is called, try `self.mesh.attr`
         to get the mesh's attribute
         """
-        if "mesh" not in self.__dict__.keys():
+        try:
+            mesh = object.__getattribute__(self, "mesh")
+        except AttributeError:
             raise AttributeError(
                 f"Actor does not have attribute {attr}"
             )  # pragma: no cover
 
         # some attributes should be from .mesh, others from ._mesh
-        mesh_attributes = ("center_of_mass",)
-        if attr in mesh_attributes:
-            if hasattr(self.__dict__["mesh"], attr):
-                return getattr(self.__dict__["mesh"], attr)
-        else:
+        if attr not in _mesh_attributes:
             try:
-                return getattr(self.__dict__["_mesh"], attr)
-            except KeyError:
-                # no ._mesh, use .mesh
-                if hasattr(self.__dict__["mesh"], attr):
-                    return getattr(self.__dict__["mesh"], attr)
+                mesh = object.__getattribute__(self, "_mesh")
+            except AttributeError:
+                pass  # no ._mesh, use .mesh
 
-        raise AttributeError(
-            f"Actor does not have attribute {attr}"
-        )  # pragma: no cover
+        value = getattr(mesh, attr, _missing)
+        if value is _missing:
+            raise AttributeError(
+                f"Actor does not have attribute {attr}"
+            )  # pragma: no cover
+        return value
 
     def __repr__(self):  # pragma: no cover
         return f"brainrender.Actor: {self.name}-{self.br_class}"
 
     def __str__(self):
-        buf = StringIO()
-        _console = Console(file=buf, force_jupyter=False)
+        try:
+            buf, _console = _str_console.buf, _str_console.console
+        except AttributeError:
+            buf = StringIO()
+            _console = Console(file=buf, force_jupyter=False)
+            _str_console.buf, _str_console.console = buf, _console
+
+        buf.seek(0)
+        buf.truncate()
         _console.print(self)
 
         return buf.getvalue()
@@ -157,9 +252,77 @@ class Actor:
     @property
     def center(self):
         """
-        Returns the coordinates of the mesh's center
+        Returns the coordinates of the mesh's center.
+        The value is cached until the mesh is modified.
         """
-        return self.mesh.center_of_mass()
+        mtime = self.mesh.dataset.GetMTime()
+        if self._com_cache is None or self._com_cache[0] != mtime:
+            self._com_cache = (mtime, self.mesh.center_of_mass())
+        return self._com_cache[1].copy()
+
+    def mirror(self, axis="x", origin=True):
+        """
+        Mirror reflects the actor's mesh along one of the cartesian axes.
+        Mirroring a single axis around (0, 0, 0) negates that coordinate
+        of the vertices in place, other cases use vedo's `mirror`.
+
+        :param axis: str, axis to use for mirroring: "x", "y", "z"
+            or any combination of those
+        :param origin: point used as the mirroring origin. If True
+            the mesh's position is used, if False (0, 0, 0)
+        :return: the Actor itself, rather than the vedo mesh
+        """
+        try:
+            mesh = object.__getattribute__(self, "_mesh")
+        except AttributeError:
+            mesh = self.mesh
+
+        # the reflection can only be concatenated to a linear transform
+        if not isinstance(mesh, Points) or not isinstance(
+            mesh.transform, LinearTransform
+        ):
+            mesh.mirror(axis, origin=origin)
+            return self
+
+        if origin is True:
+            origin = mesh.transform.position
+        elif origin is False:
+            origin = (0, 0, 0)
+
+        axis = axis.lower()
+        if axis not in ("x", "y", "z") or np.any(origin):
+            mesh.mirror(axis, origin=origin)
+            return self
+
+        if mesh.dataset.GetNumberOfPoints() == 0:
+            return self
+
+        col = "xyz".index(axis)
+        vertices = mesh.vertices
+        np.negative(vertices[:, col], out=vertices[:, col])
+        mesh.dataset.GetPoints().Modified()
+
+        # reflect point and cell normals too
+        for data in (mesh.dataset.GetPointData(), mesh.dataset.GetCellData()):
+            normals = data.GetNormals()
+            if normals is not None:
+                arr = vtk2numpy(normals)
+                np.negative(arr[:, col], out=arr[:, col])
+                normals.Modified()
+
+        scale = [1, 1, 1]
+        scale[col] = -1
+        mesh.transform.concatenate(LinearTransform().scale(scale))
+        mesh.point_locator = None
+        mesh.cell_locator = None
+        mesh.line_locator = None
+        mesh.pipeline = OperationNode(
+            "mirror", comment=f"axis = {axis}", parents=[mesh]
+        )
+
+        # a single reflection flips the faces orientation
+        mesh.reverse()
+        return self
 
     @classmethod
     def make_actor(cls, mesh, name, br_class):
@@ -190,6 +353,13 @@ class Actor:
         """
         lw = self._silhouette_kwargs["lw"]
         color = self._silhouette_kwargs["color"]
+
+        # re-use the existing silhouette if the mesh hasn't changed
+        key = (id(self._mesh), self._mesh.dataset.GetMTime(), lw, color)
+        if self.silhouette is not None and key == self._silhouette_key:
+            self._needs_silhouette = False
+            return self.silhouette
+
         sil = self._mesh.silhouette().lw(lw).c(color)
 
         name = f"{self.name} silhouette"
@@ -198,6 +368,7 @@ class Actor:
 
         self._needs_silhouette = False
         self.silhouette = sil
+        self._silhouette_key = key
 
         return sil
 
@@ -205,25 +376,26 @@ class Actor:
         """
         Print some useful characteristics to console.
         """
+        if self._com_buf is None:
+            self._com_buf = np.empty(3, dtype=np.int32)
+            self._bounds_buf = np.empty(6, dtype=np.int32)
+        np.rint(self.center, out=self._com_buf, casting="unsafe")
+        np.rint(self.mesh.bounds(), out=self._bounds_buf, casting="unsafe")
+
         rep = pi.Report(
             title="[b]brainrender.Actor: ",
             color=salmon,
             accent=orange,
         )
 
-        rep.add(f"[b {orange}]name:[/b {orange}][{amber}] {self.name}")
-        rep.add(f"[b {orange}]type:[/b {orange}][{amber}] {self.br_class}")
+        rep.add(f"{_rep_name}{self.name}\n{_rep_type}{self.br_class}")
         rep.line()
         rep.add(
-            f"[{orange}]center of mass:[/{orange}][{amber}] {self.mesh.center_of_mass().astype(np.int32)}"
-        )
-        rep.add(
-            f"[{orange}]number of vertices:[/{orange}][{amber}] {self.mesh.npoints}"
-        )
-        rep.add(
-            f"[{orange}]dimensions:[/{orange}][{amber}] {np.array(self.mesh.bounds()).astype(np.int32)}"
+            f"{_rep_com}{self._com_buf}\n"
+            f"{_rep_npoints}{self.mesh.npoints}\n"
+            f"{_rep_dimensions}{self._bounds_buf}\n"
+            f"{_rep_color}{self.mesh.color()}"
         )
-        rep.add(f"[{orange}]color:[/{orange}][{amber}] {self.mesh.color()}")
 
         yield "\n"
         yield rep
@@ -32,6 +32,39 @@ def make_streamlines(
     ]
 
 
+def make_streamlines_soa(
+    points,
+    offsets,
+    injection_sites=None,
+    color="salmon",
+    alpha=1,
+    radius=10,
+):
+    """
+    Creates Streamlines from flat arrays of points, without going
+    through a pd.DataFrame for each streamline.
+    :param points: np.ndarray of shape (N, 3) with the points of all streamlines
+    :param offsets: np.ndarray of integers with the index in `points`
+        at which each streamline starts, followed by N
+    :param injection_sites: np.ndarray of shape (M, 3) with injection sites
+        coordinates. If None no injection site is shown
+    :param radius: float. Radius of the Tube mesh used to render streamlines
+    :param color: str, name of the color to be used
+    :param alpha: float, transparency
+    :return: list with a single Streamlines actor
+    """
+    return [
+        Streamlines.from_soa(
+            points,
+            offsets,
+            injection_sites=injection_sites,
+            color=color,
+            alpha=alpha,
+            radius=radius,
+        )
+    ]
+
+
 class Streamlines(Actor):
     """
     Streamliens actor class.
@@ -46,25 +79,55 @@ class Streamlines(Actor):
         alpha=1,
         show_injection=True,
         name=None,
+        injection_sites=None,
     ):
         """
         Turns streamlines data to a mesh.
-        :param data: pd.DataFrame with streamlines points data
+        :param data: pd.DataFrame with streamlines points data, or a list
+            of np.ndarray of shape (N, 3) with the points of each streamline
         :param radius: float. Radius of the Tube mesh used to render streamlines
         :param color: str, name of the color to be used
         :param alpha: float, transparency
         :param name: str, name of the actor.
         :param show_injection: bool. If true spheres mark the injection sites
+        :param injection_sites: np.ndarray of shape (M, 3) with injection sites
+            coordinates. Only used when data is a list of arrays, with
+            a dataframe the injection sites are read from the data
         """
         logger.debug("Creating a streamlines actor")
         if isinstance(data, (str, Path)):
             data = pd.read_json(data)
-        elif not isinstance(data, pd.DataFrame):
-            raise TypeError("Input data should be a dataframe")
+
+        if isinstance(data, pd.DataFrame):
+            if injection_sites is not None:
+                raise ValueError(
+                    "Injection sites can only be passed with a list of arrays"
+                )
+            lines, injection_sites = self._lines_from_data(
+                data, show_injection=show_injection
+            )
+        elif (
+            isinstance(data, list)
+            and data
+            and all(isinstance(line, np.ndarray) for line in data)
+        ):
+            for line in data:
+                if line.ndim != 2 or line.shape[1] != 3 or len(line) < 2:
+                    raise ValueError(
+                        "Each streamline should be an array of shape (N, 3) "
+                        "with at least 2 points"
+                    )
+            lines = data
+            if not show_injection:
+                injection_sites = None
+        else:
+            raise TypeError(
+                "Input data should be a dataframe or a list of arrays"
+            )
 
         self.radius = radius
         mesh = (
-            self._make_mesh(data, show_injection=show_injection)
+            self._make_lines_mesh(lines, injection_sites)
             .c(color)
             .alpha(alpha)
             .clean()
@@ -73,8 +136,59 @@ class Streamlines(Actor):
         name = name or "Streamlines"
         Actor.__init__(self, mesh, name=name, br_class="Streamliness")
 
-    def _make_mesh(self, data, show_injection=True):
-        lines = []
+    @classmethod
+    def from_soa(
+        cls,
+        points,
+        offsets,
+        injection_sites=None,
+        radius=10,
+        color="salmon",
+        alpha=1,
+        name=None,
+    ):
+        """
+        Turns flat arrays of streamlines points to a mesh.
+        :param points: np.ndarray of shape (N, 3) with the points of all streamlines
+        :param offsets: np.ndarray of integers with the index in `points`
+            at which each streamline starts, followed by N. Each
+            streamline needs at least 2 points
+        :param injection_sites: np.ndarray of shape (M, 3) with injection sites
+            coordinates. If None no injection site is shown
+        :param radius: float. Radius of the Tube mesh used to render streamlines
+        :param color: str, name of the color to be used
+        :param alpha: float, transparency
+        :param name: str, name of the actor.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        offsets = np.asarray(offsets)
+        if (
+            offsets.ndim != 1
+            or not np.issubdtype(offsets.dtype, np.integer)
+            or len(offsets) < 2
+            or offsets[0] != 0
+            or offsets[-1] != len(points)
+            or np.any(np.diff(offsets) <= 0)
+        ):
+            raise ValueError(
+                "Offsets should be increasing integers going from 0 "
+                "to the number of points"
+            )
+
+        return cls(
+            np.split(points, offsets[1:-1]),
+            radius=radius,
+            color=color,
+            alpha=alpha,
+            name=name,
+            injection_sites=injection_sites,
+        )
+
+    def _lines_from_data(self, data, show_injection=True):
+        """
+        Extracts each streamline's points, and the injection sites
+        coordinates if they should be shown, from streamlines data.
+        """
         if len(data["lines"]) == 1:
             try:
                 lines_data = data["lines"][0]
@@ -83,16 +197,12 @@ class Streamlines(Actor):
         else:
             lines_data = data["lines"]
 
-        for line in lines_data:
-            points = [[lin["x"], lin["y"], lin["z"]] for lin in line]
-            lines.append(
-                Tube(
-                    points,
-                    r=self.radius,
-                    res=8,
-                )
-            )
+        lines = [
+            [[lin["x"], lin["y"], lin["z"]] for lin in line]
+            for line in lines_data
+        ]
 
+        coords = None
         if show_injection:
             coords = np.vstack(
                 [
@@ -100,12 +210,23 @@ class Streamlines(Actor):
                     for point in data.injection_sites.iloc[0]
                 ]
             )
-            lines.append(
+
+        return lines, coords
+
+    def _make_lines_mesh(self, lines, injection_sites=None):
+        """
+        Merges a Tube for each line, and spheres at the injection
+        sites if any are given, into a single mesh.
+        """
+        meshes = [Tube(points, r=self.radius, res=8) for points in lines]
+
+        if injection_sites is not None:
+            meshes.append(
                 Spheres(
-                    coords,
+                    injection_sites,
                     r=self.radius * 10,
                     res=8,
                 )
             )
 
-        return merge(*lines)
+        return merge(*meshes)
@@ -1,8 +1,31 @@
+import numpy as np
 from rich import print as rprint
-from vedo import Mesh
+from vedo import Cube, Mesh, Sphere, Text3D
 
 from brainrender import Scene
-from brainrender.actor import Actor
+from brainrender.actor import Actor, make_actor_label
+
+
+class MockAtlas:
+    """
+    Atlas with a 100 voxels wide volume, left hemisphere for z < 50
+    """
+
+    shape = (100, 100, 100)
+    left_hemisphere_value = 1
+
+    def __init__(self):
+        self.hemispheres = np.full(self.shape, 2, dtype=np.uint8)
+        self.hemispheres[:, :, :50] = 1
+
+    def hemisphere_from_coords(self, coords, as_string=False):
+        hem = self.hemispheres[tuple(int(c) for c in coords)]
+        return ["left", "right"][hem - 1] if as_string else hem
+
+    def mirror_point_across_hemispheres(self, point):
+        point = np.array(point, dtype=np.float64)
+        point[2] = 99 - point[2]
+        return point
 
 
 def test_actor():
@@ -18,3 +41,65 @@ def test_actor():
     assert s.alpha() == s.mesh.alpha()
     assert s.name == "root"
     assert s.br_class == "brain region"
+
+
+def test_actor_center():
+    actor = Actor(Sphere(pos=(10, 20, 30)))
+    assert np.allclose(actor.center, [10, 20, 30])
+
+    # cache is refreshed when the mesh changes
+    actor.mesh.pos(0, 0, 0)
+    assert np.allclose(actor.center, [0, 0, 0])
+
+
+def test_actor_mirror():
+    for axis in "xyz":
+        actor = Actor(Sphere(pos=(10, 20, 30)).compute_normals())
+        expected = actor.mesh.clone().mirror(axis, origin=False)
+
+        actor.mirror(axis, origin=False)
+        assert np.allclose(actor.mesh.vertices, expected.vertices)
+        assert np.allclose(actor.mesh.vertex_normals, expected.vertex_normals)
+        assert np.allclose(actor.bounds(), expected.bounds())
+        assert np.allclose(actor.center, expected.center_of_mass())
+
+
+def test_make_actor_label():
+    atlas = MockAtlas()
+    actors = [
+        Actor(Cube(pos=(-440, 200, -120), side=2)),  # left hemisphere
+        Actor(Cube(pos=(-440, 200, -170), side=2)),  # right hemisphere
+        Actor(Cube(pos=(0, 200, -120), side=2)),  # outside the atlas
+        Actor(Cube(pos=(-440, 200, -120), side=2)),  # no label
+    ]
+    labels = ["left", "right", "outside"]
+
+    new_actors = make_actor_label(atlas, actors, labels, radius=5)
+    assert len(new_actors) == 6
+    texts, spheres = new_actors[:3], new_actors[3:]
+
+    # compare with labelling each actor on its own
+    mirrored = []
+    for actor, label, text, sphere in zip(actors, labels, texts, spheres):
+        vertices = actor.mesh.vertices
+        # default offsets: yoffset=-500 and [0, -200, 100]
+        point = vertices[np.argmin(vertices[:, 1])] + [500, -200, 100]
+        point[2] = -point[2]
+        try:
+            is_left = atlas.hemisphere_from_coords(point, as_string=True)
+            is_left = is_left == "left"
+        except IndexError:
+            is_left = False
+        if is_left:
+            point = atlas.mirror_point_across_hemispheres(point)
+        mirrored.append(is_left)
+
+        expected = Text3D(label, -point, s=300, depth=0.1)
+        expected.rotate_x(180).rotate_y(180)
+        assert np.allclose(text.vertices, expected.vertices, atol=1e-3)
+
+        anchor = actor.closest_point(point)
+        anchor[2] = -anchor[2]
+        assert np.allclose(sphere.center_of_mass(), anchor, atol=1e-3)
+
+    assert mirrored == [True, False, False]
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -5,6 +6,7 @@ from brainrender import Scene
 from brainrender.actors.streamlines import (
     Streamlines,
     make_streamlines,
+    make_streamlines_soa,
 )
 from brainrender.atlas_specific import get_streamlines_for_region
 
@@ -34,3 +36,56 @@ def test_streamlines():
         Streamlines([1, 2, 3])
 
     del s
+
+
+def test_streamlines_from_soa():
+    points = np.random.uniform(0, 5000, size=(20, 3))
+    offsets = np.array([0, 5, 12, 20])
+    injection_sites = np.array([[100.0, 200.0, 300.0]])
+
+    # same streamlines as dataframe
+    lines = np.split(points, offsets[1:-1])
+    data = pd.DataFrame(
+        {
+            "lines": [
+                [[dict(x=x, y=y, z=z) for x, y, z in line] for line in lines]
+            ],
+            "injection_sites": [[dict(x=100.0, y=200.0, z=300.0)]],
+        }
+    )
+
+    streams = Streamlines.from_soa(
+        points, offsets, injection_sites=injection_sites
+    )
+    expected = Streamlines(data)
+    assert isinstance(streams, Streamlines)
+    assert np.allclose(streams.mesh.vertices, expected.mesh.vertices)
+
+    # injection sites add the spheres' vertices
+    no_injection = Streamlines.from_soa(points, offsets)
+    assert no_injection.mesh.npoints < streams.mesh.npoints
+    assert np.allclose(
+        no_injection.mesh.vertices,
+        Streamlines(data, show_injection=False).mesh.vertices,
+    )
+
+    (stream,) = make_streamlines_soa(points, offsets)
+    assert np.allclose(stream.mesh.vertices, no_injection.mesh.vertices)
+
+    for bad_offsets in (
+        [0, 5, 5, 20],
+        [2, 5, 20],
+        [0, 5, 12],
+        [0, 1, 20],
+        [0.0, 5.0, 20.0],
+        [[0, 5, 20]],
+    ):
+        with pytest.raises(ValueError):
+            Streamlines.from_soa(points, bad_offsets)
+
+    for bad_lines in ([points[:1]], [points[:5, :2]], [points[:5, 0]]):
+        with pytest.raises(ValueError):
+            Streamlines(bad_lines)
+
+    with pytest.raises(ValueError):
+        Streamlines(data, injection_sites=injection_sites)